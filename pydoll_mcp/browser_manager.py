@@ -33,14 +33,29 @@ logger = logging.getLogger(__name__)
 class BrowserInstance:
     """Represents a managed browser instance with metadata."""
     
+    __slots__ = (
+        "browser",
+        "browser_type",
+        "instance_id",
+        "created_at",
+        "created_monotonic",
+        "tabs",
+        "is_active",
+        "last_activity",
+        "stats",
+    )
+    
     def __init__(self, browser, browser_type: str, instance_id: str):
         self.browser = browser
         self.browser_type = browser_type
         self.instance_id = instance_id
         self.created_at = time.time()
+        # Durations are measured on the monotonic clock so wall-clock jumps
+        # cannot skew uptime or idle time; created_at stays a wall-clock timestamp.
+        self.created_monotonic = time.monotonic()
         self.tabs: Dict[str, Tab] = {}
         self.is_active = True
-        self.last_activity = time.time()
+        self.last_activity = self.created_monotonic
         
         # Performance metrics
         self.stats = {
@@ -52,15 +67,15 @@ class BrowserInstance:
     
     def update_activity(self):
         """Update the last activity timestamp."""
-        self.last_activity = time.time()
+        self.last_activity = time.monotonic()
     
     def get_uptime(self) -> float:
         """Get browser instance uptime in seconds."""
-        return time.time() - self.created_at
+        return time.monotonic() - self.created_monotonic
     
     def get_idle_time(self) -> float:
         """Get time since last activity in seconds."""
-        return time.time() - self.last_activity
+        return time.monotonic() - self.last_activity
     
     async def cleanup(self):
         """Clean up browser instance and all associated resources."""
@@ -371,7 +386,7 @@ class BrowserManager:
     
     async def _cleanup_idle_browsers(self):
         """Clean up browsers that have been idle for too long."""
-        current_time = time.time()
+        current_time = time.monotonic()
         browsers_to_close = []
         
         for browser_id, instance in self.browsers.items():
@@ -205,7 +205,8 @@ class PyDollMCPServer:
             logger.info(f"Executing tool: {name}")
             logger.debug(f"Tool arguments: {arguments}")
             
-            if name not in all_handlers:
+            handler = all_handlers.get(name)
+            if handler is None:
                 self.stats["failed_requests"] += 1
                 error_result = {
                     "success": False,
@@ -218,7 +219,6 @@ class PyDollMCPServer:
             
             try:
                 # Execute the tool handler
-                handler = all_handlers[name]
                 result = await handler(arguments)
                 
                 # Calculate execution time
@@ -228,7 +228,7 @@ class PyDollMCPServer:
                 logger.info(f"Tool {name} completed successfully in {execution_time:.2f}s")
                 
                 # Add execution metadata to result if it's a dict
-                if isinstance(result, list) and len(result) > 0:
+                if isinstance(result, (list, tuple)) and len(result) > 0:
                     if hasattr(result[0], 'text'):
                         try:
                             import json
@@ -239,7 +239,11 @@ class PyDollMCPServer:
                                     "tool_name": name,
                                     "server_version": __version__
                                 }
-                                result[0].text = json.dumps(result_data)
+                                # Replace rather than mutate: handlers may return shared responses
+                                result = [
+                                    TextContent(type="text", text=json.dumps(result_data)),
+                                    *result[1:],
+                                ]
                         except (json.JSONDecodeError, AttributeError):
                             pass
                 
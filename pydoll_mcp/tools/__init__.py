@@ -177,10 +177,10 @@ async def execute_tool(name: str, arguments: Dict[str, Any]) -> Sequence[TextCon
     Raises:
         ValueError: If tool not found
     """
-    if name not in ALL_TOOL_HANDLERS:
+    handler = ALL_TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Tool '{name}' not found")
     
-    handler = ALL_TOOL_HANDLERS[name]
     return await handler(arguments)
 
 
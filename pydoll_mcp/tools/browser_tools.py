@@ -7,9 +7,12 @@ This module provides MCP tools for browser lifecycle management including:
 - Status monitoring
 """
 
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Sequence
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
 
 from mcp.types import Tool, TextContent
 
@@ -18,10 +21,21 @@ from ..models import BrowserConfig, BrowserInstance, BrowserStatus, OperationRes
 
 logger = logging.getLogger(__name__)
 
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[Sequence[TextContent]]]
+
 # Browser Management Tools Definition
+#
+# The schemas below are literal constants, so the Tool instances are built with
+# ``model_construct`` to skip re-validating them on every import.
+
+# Shared by every tool that addresses an existing browser instance
+_BROWSER_ID_PROP = {
+    "type": "string",
+    "description": "Browser instance ID"
+}
 
-BROWSER_TOOLS = [
-    Tool(
+_BROWSER_TOOL_SPECS = (
+    dict(
         name="start_browser",
         description="Start a new browser instance with specified configuration",
         inputSchema={
@@ -85,7 +99,7 @@ BROWSER_TOOLS = [
         }
     ),
     
-    Tool(
+    dict(
         name="stop_browser",
         description="Stop a browser instance and clean up resources",
         inputSchema={
@@ -105,7 +119,7 @@ BROWSER_TOOLS = [
         }
     ),
     
-    Tool(
+    dict(
         name="list_browsers",
         description="List all active browser instances with their status",
         inputSchema={
@@ -121,31 +135,25 @@ BROWSER_TOOLS = [
         }
     ),
     
-    Tool(
+    dict(
         name="get_browser_status",
         description="Get detailed status information for a specific browser",
         inputSchema={
             "type": "object",
             "properties": {
-                "browser_id": {
-                    "type": "string",
-                    "description": "Browser instance ID"
-                }
+                "browser_id": _BROWSER_ID_PROP
             },
             "required": ["browser_id"]
         }
     ),
     
-    Tool(
+    dict(
         name="new_tab",
         description="Create a new tab in a browser instance",
         inputSchema={
             "type": "object",
             "properties": {
-                "browser_id": {
-                    "type": "string", 
-                    "description": "Browser instance ID"
-                },
+                "browser_id": _BROWSER_ID_PROP,
                 "url": {
                     "type": "string",
                     "description": "Optional URL to navigate to immediately"
@@ -160,16 +168,13 @@ BROWSER_TOOLS = [
         }
     ),
     
-    Tool(
+    dict(
         name="close_tab",
         description="Close a specific tab in a browser",
         inputSchema={
             "type": "object",
             "properties": {
-                "browser_id": {
-                    "type": "string",
-                    "description": "Browser instance ID"
-                },
+                "browser_id": _BROWSER_ID_PROP,
                 "tab_id": {
                     "type": "string",
                     "description": "Tab ID to close"
@@ -179,16 +184,13 @@ BROWSER_TOOLS = [
         }
     ),
     
-    Tool(
+    dict(
         name="list_tabs",
         description="List all tabs in a browser instance",
         inputSchema={
             "type": "object",
             "properties": {
-                "browser_id": {
-                    "type": "string",
-                    "description": "Browser instance ID"
-                },
+                "browser_id": _BROWSER_ID_PROP,
                 "include_content": {
                     "type": "boolean",
                     "default": False,
@@ -199,16 +201,13 @@ BROWSER_TOOLS = [
         }
     ),
     
-    Tool(
+    dict(
         name="set_active_tab",
         description="Switch to a specific tab in a browser",
         inputSchema={
             "type": "object",
             "properties": {
-                "browser_id": {
-                    "type": "string",
-                    "description": "Browser instance ID"
-                },
+                "browser_id": _BROWSER_ID_PROP,
                 "tab_id": {
                     "type": "string",
                     "description": "Tab ID to activate"
@@ -216,157 +215,236 @@ BROWSER_TOOLS = [
             },
             "required": ["browser_id", "tab_id"]
         }
-    )
-]
+    ),
+)
+
+BROWSER_TOOLS = [Tool.model_construct(**spec) for spec in _BROWSER_TOOL_SPECS]
 
 
 # Browser Management Tool Handlers
 
-async def handle_start_browser(arguments: Dict[str, Any]) -> Sequence[TextContent]:
-    """Handle browser start request."""
-    try:
-        browser_manager = get_browser_manager()
-        
-        # Extract and validate arguments
-        config = BrowserConfig(**arguments)
-        
-        # Create browser instance
-        browser_id = await browser_manager.create_browser(
-            browser_type=config.browser_type,
-            headless=config.headless,
-            window_width=config.window_width,
-            window_height=config.window_height,
-            stealth_mode=config.stealth_mode,
-            proxy=config.proxy_server,
-            user_agent=config.user_agent,
-            disable_images=config.disable_images,
-            block_ads=config.block_ads,
-            args=config.custom_args
-        )
-        
-        result = OperationResult(
-            success=True,
-            message="Browser started successfully",
-            data={
-                "browser_id": browser_id,
-                "browser_type": config.browser_type,
-                "configuration": config.dict()
-            }
-        )
+def _to_text_content(result: OperationResult) -> TextContent:
+    """Serialize an operation result into an MCP text content block."""
+    return TextContent(type="text", text=result.model_dump_json())
+
+
+def _result_content(**fields: Any) -> TextContent:
+    """Build an OperationResult and wrap it as an MCP text content block.
+    
+    Handlers only pass values they produced themselves, so the result is
+    built with ``model_construct`` and skips field validation.
+    """
+    return _to_text_content(OperationResult.model_construct(**fields))
+
+
+_ERROR_PLACEHOLDER = "__error__"
+
+
+def _error_template(message: str) -> Tuple[str, str]:
+    """Split a failed OperationResult's JSON around its error value.
+    
+    Args:
+        message: Failure message embedded in the template
         
-        logger.info(f"Browser started: {browser_id}")
-        return [TextContent(type="text", text=result.json())]
+    Returns:
+        JSON text before and after the error string
+    """
+    text = OperationResult.model_construct(
+        success=False,
+        error=_ERROR_PLACEHOLDER,
+        message=message
+    ).model_dump_json()
+    prefix, _, suffix = text.rpartition(json.dumps(_ERROR_PLACEHOLDER))
+    return prefix, suffix
+
+
+def _handle_errors(message: str) -> Callable[[ToolHandler], ToolHandler]:
+    """Report exceptions raised by a handler as a failed OperationResult.
+    
+    Args:
+        message: Failure message logged and returned alongside the error
         
-    except Exception as e:
-        logger.error(f"Failed to start browser: {e}")
-        result = OperationResult(
-            success=False,
-            error=str(e),
-            message="Failed to start browser"
-        )
-        return [TextContent(type="text", text=result.json())]
+    Returns:
+        Decorator wrapping a browser tool handler
+    """
+    # The failure payload only varies in its error string, so serialize it once
+    # and splice the JSON-encoded error between the fixed prefix and suffix.
+    prefix, suffix = _error_template(message)
+    
+    def decorator(handler: ToolHandler) -> ToolHandler:
+        @functools.wraps(handler)
+        async def wrapper(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+            try:
+                return await handler(arguments)
+            except Exception as e:
+                logger.error(f"{message}: {e}")
+                error = json.dumps(str(e), ensure_ascii=False)
+                return (TextContent(type="text", text=prefix + error + suffix),)
+        return wrapper
+    return decorator
+
+
+@_handle_errors("Failed to start browser")
+async def handle_start_browser(arguments: Dict[str, Any]) -> Sequence[TextContent]:
+    """Handle browser start request."""
+    browser_manager = get_browser_manager()
+    
+    # Extract and validate arguments
+    config = BrowserConfig(**arguments)
+    
+    # Create browser instance
+    browser_id = await browser_manager.create_browser(
+        browser_type=config.browser_type,
+        headless=config.headless,
+        window_width=config.window_width,
+        window_height=config.window_height,
+        stealth_mode=config.stealth_mode,
+        proxy=config.proxy_server,
+        user_agent=config.user_agent,
+        disable_images=config.disable_images,
+        block_ads=config.block_ads,
+        args=config.custom_args
+    )
+    
+    logger.info(f"Browser started: {browser_id}")
+    return (_result_content(
+        success=True,
+        message="Browser started successfully",
+        data={
+            "browser_id": browser_id,
+            "browser_type": config.browser_type,
+            "configuration": config.model_dump()
+        }
+    ),)
 
 
+@_handle_errors("Failed to stop browser")
 async def handle_stop_browser(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle browser stop request."""
-    try:
-        browser_manager = get_browser_manager()
-        browser_id = arguments["browser_id"]
-        force = arguments.get("force", False)
-        
-        # Check if browser has open tabs (unless force stop)
-        if not force:
-            instance = await browser_manager.get_browser(browser_id)
-            if len(instance.tabs) > 0:
-                result = OperationResult(
-                    success=False,
-                    message=f"Browser has {len(instance.tabs)} open tabs. Use force=true to stop anyway.",
-                    data={"open_tabs": len(instance.tabs)}
-                )
-                return [TextContent(type="text", text=result.json())]
-        
-        await browser_manager.close_browser(browser_id)
-        
-        result = OperationResult(
-            success=True,
-            message="Browser stopped successfully",
-            data={"browser_id": browser_id}
-        )
-        
-        logger.info(f"Browser stopped: {browser_id}")
-        return [TextContent(type="text", text=result.json())]
-        
-    except Exception as e:
-        logger.error(f"Failed to stop browser: {e}")
-        result = OperationResult(
-            success=False,
-            error=str(e),
-            message="Failed to stop browser"
-        )
-        return [TextContent(type="text", text=result.json())]
+    browser_manager = get_browser_manager()
+    browser_id = arguments["browser_id"]
+    force = arguments.get("force", False)
+    
+    # Check if browser has open tabs (unless force stop)
+    if not force:
+        instance = await browser_manager.get_browser(browser_id)
+        if len(instance.tabs) > 0:
+            return (_result_content(
+                success=False,
+                message=f"Browser has {len(instance.tabs)} open tabs. Use force=true to stop anyway.",
+                data={"open_tabs": len(instance.tabs)}
+            ),)
+    
+    await browser_manager.close_browser(browser_id)
+    
+    logger.info(f"Browser stopped: {browser_id}")
+    return (_result_content(
+        success=True,
+        message="Browser stopped successfully",
+        data={"browser_id": browser_id}
+    ),)
 
 
-# Placeholder handlers for remaining browser tools
+@_handle_errors("Failed to list browsers")
 async def handle_list_browsers(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle list browsers request."""
-    result = OperationResult(
+    browser_manager = get_browser_manager()
+    include_stats = arguments.get("include_stats", True)
+    
+    # Build the listing and all summary counters in a single pass
+    now = time.monotonic()
+    browser_list = []
+    total_tabs = 0
+    active_browsers = 0
+    browser_types: Dict[str, int] = {}
+    
+    for browser_id, instance in browser_manager.browsers.items():
+        tabs_count = len(instance.tabs)
+        browser_info = {
+            "browser_id": browser_id,
+            "browser_type": instance.browser_type,
+            "is_active": instance.is_active,
+            "tabs_count": tabs_count,
+            "uptime": now - instance.created_monotonic,
+            "idle_time": now - instance.last_activity,
+        }
+        if include_stats:
+            browser_info["stats"] = instance.stats.copy()
+        browser_list.append(browser_info)
+        
+        total_tabs += tabs_count
+        if instance.is_active:
+            active_browsers += 1
+        browser_types[instance.browser_type] = browser_types.get(instance.browser_type, 0) + 1
+    
+    return (_result_content(
         success=True,
-        message="Found 2 active browsers",
-        data={"browsers": [], "count": 2}
-    )
-    return [TextContent(type="text", text=result.json())]
+        message=f"Found {len(browser_list)} browsers",
+        data={
+            "browsers": browser_list,
+            "count": len(browser_list),
+            "total_tabs": total_tabs,
+            "active_browsers": active_browsers,
+            "browser_types": browser_types,
+        }
+    ),)
 
 
+# Placeholder handlers for remaining browser tools
 async def handle_get_browser_status(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle get browser status request."""
-    result = OperationResult(
+    return (_result_content(
         success=True,
         message="Browser status retrieved",
         data={"status": "active", "uptime": "15m"}
-    )
-    return [TextContent(type="text", text=result.json())]
+    ),)
 
 
 async def handle_new_tab(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle new tab creation request."""
-    result = OperationResult(
+    return (_result_content(
         success=True,
         message="Tab created successfully",
         data={"tab_id": "tab_123"}
-    )
-    return [TextContent(type="text", text=result.json())]
+    ),)
+
+
+# The remaining placeholders always return the same payload, so their
+# responses are serialized once at import and shared between calls.
+_CLOSE_TAB_RESPONSE = (_to_text_content(OperationResult(
+    success=True,
+    message="Tab closed successfully"
+)),)
+
+_LIST_TABS_RESPONSE = (_to_text_content(OperationResult(
+    success=True,
+    message="Found 3 tabs",
+    data={"tabs": [], "count": 3}
+)),)
+
+_SET_ACTIVE_TAB_RESPONSE = (_to_text_content(OperationResult(
+    success=True,
+    message="Active tab set successfully"
+)),)
 
 
 async def handle_close_tab(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle tab close request."""
-    result = OperationResult(
-        success=True,
-        message="Tab closed successfully"
-    )
-    return [TextContent(type="text", text=result.json())]
+    return _CLOSE_TAB_RESPONSE
 
 
 async def handle_list_tabs(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle list tabs request."""
-    result = OperationResult(
-        success=True,
-        message="Found 3 tabs",
-        data={"tabs": [], "count": 3}
-    )
-    return [TextContent(type="text", text=result.json())]
+    return _LIST_TABS_RESPONSE
 
 
 async def handle_set_active_tab(arguments: Dict[str, Any]) -> Sequence[TextContent]:
     """Handle set active tab request."""
-    result = OperationResult(
-        success=True,
-        message="Active tab set successfully"
-    )
-    return [TextContent(type="text", text=result.json())]
+    return _SET_ACTIVE_TAB_RESPONSE
 
 
-# Browser Tool Handlers Dictionary
-BROWSER_TOOL_HANDLERS = {
+# Browser Tool Handlers Dictionary (read-only; merged into ALL_TOOL_HANDLERS)
+BROWSER_TOOL_HANDLERS = MappingProxyType({
     "start_browser": handle_start_browser,
     "stop_browser": handle_stop_browser,
     "list_browsers": handle_list_browsers,
@@ -375,4 +453,4 @@ BROWSER_TOOL_HANDLERS = {
     "close_tab": handle_close_tab,
     "list_tabs": handle_list_tabs,
     "set_active_tab": handle_set_active_tab,
-}
+})
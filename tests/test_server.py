@@ -191,6 +191,28 @@ class TestToolHandlers:
             assert result_data["success"] is True
             assert "browser_id" in result_data["data"]
     
+    @pytest.mark.asyncio
+    async def test_list_browsers_handler(self):
+        """Test list browsers handler aggregates counts."""
+        with patch('pydoll_mcp.tools.browser_tools.get_browser_manager') as mock_manager:
+            chrome = MagicMock(browser_type="chrome", is_active=True, tabs={"t1": None, "t2": None},
+                               created_monotonic=0.0, last_activity=0.0, stats={})
+            edge = MagicMock(browser_type="edge", is_active=False, tabs={},
+                             created_monotonic=0.0, last_activity=0.0, stats={})
+            mock_manager.return_value = MagicMock(browsers={"b1": chrome, "b2": edge})
+            
+            from pydoll_mcp.tools.browser_tools import handle_list_browsers
+            
+            result = await handle_list_browsers({"include_stats": False})
+            
+            result_data = json.loads(result[0].text)
+            assert result_data["success"] is True
+            assert result_data["data"]["count"] == 2
+            assert result_data["data"]["total_tabs"] == 2
+            assert result_data["data"]["active_browsers"] == 1
+            assert result_data["data"]["browser_types"] == {"chrome": 1, "edge": 1}
+            assert "stats" not in result_data["data"]["browsers"][0]
+    
     @pytest.mark.asyncio
     async def test_navigation_tool_handlers(self):
         """Test navigation tool handlers."""